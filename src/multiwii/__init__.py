@@ -93,11 +93,15 @@ from .data import (
 
 from .messaging import (
     _crc8_xor,
-    _create_request_message,
+    _create_empty_request_message,
+    _MESSAGE_ERROR_HEADER_VALUE,
+    _MESSAGE_INCOMING_HEADER_VALUE,
     _MspResponseMessage,
+    _pack_request_message,
     _parse_response_message,
     MESSAGE_ERROR_HEADER,
     MESSAGE_INCOMING_HEADER,
+    MESSAGE_MAX_SIZE,
     MspMessageError
 )
 
@@ -121,6 +125,13 @@ class MultiWii(object):
     Note
     ----
     This class can be imported directly through the main module.
+
+    Note
+    ----
+    An instance must not be shared across threads. Request and response messages are
+    serialized into buffers that are allocated once per instance and reused for every message,
+    and a request-response exchange on the serial port is not atomic either. Use a lock around
+    all calls, or a separate instance and serial port per thread.
     """
     DEFAULT_MESSAGE_WRITE_READ_DELAY: Final[float] = 0.005
     """float: The default delay in seconds between writing and reading messages."""
@@ -130,6 +141,10 @@ class MultiWii(object):
 
     _message_write_read_delay: float
 
+    _request_buffer: Final[memoryview]
+
+    _response_buffer: Final[memoryview]
+
     _serial_port: Final[Serial]
 
     def __init__(self, serial_port: Serial) -> NoReturn:
@@ -183,6 +198,10 @@ class MultiWii(object):
 
         self._message_write_read_delay = self.DEFAULT_MESSAGE_WRITE_READ_DELAY
 
+        self._request_buffer = memoryview(bytearray(MESSAGE_MAX_SIZE))
+
+        self._response_buffer = memoryview(bytearray(MESSAGE_MAX_SIZE))
+
         self._serial_port = serial_port
 
     @property
@@ -233,23 +252,61 @@ class MultiWii(object):
         Parameters
         ----------
         value : float
-            The delay in seconds.
+            The delay in seconds. Any value convertible to a float is accepted.
 
         Raises
         ------
         TypeError
-            If the value is not a float.
+            If the value cannot be converted to a float.
         ValueError
             If the value is a negative number.
         """
-        if not isinstance(value, float):
-            raise TypeError('Value must be a float.')
+        try:
+            value = float(value)
+        except (TypeError, ValueError):
+            raise TypeError('Value must be convertible to a float.') from None
 
         if value < 0:
             raise ValueError('Value must be a non-negative number.')
             
         self._message_write_read_delay = value
 
+    def _hold_raw_rc(self, data: MspRc, duration: float, interval: float) -> NoReturn:
+        """
+        Repeatedly sends the provided raw RC values to the FC for a given duration.
+
+        Writes are scheduled at a whole number of fixed intervals from the start time, so the
+        time spent serializing and writing each message is deducted from the following sleep
+        instead of being added to it. Intervals that have already passed, e.g. after a stalled
+        write, are skipped instead of being written back to back.
+
+        Parameters
+        ----------
+        data : MspRc
+            An instance of the `MspRc` class populated with values.
+        duration : float
+            The duration in seconds to keep sending the values.
+        interval : float
+            The interval in seconds between each write.
+        """
+        start_time = perf_counter()
+
+        write_count = round(duration / interval)
+
+        write_index = 0
+
+        while write_index < write_count:
+            self.set_raw_rc(data)
+
+            elapsed_count = int((perf_counter() - start_time) / interval)
+
+            write_index = max(write_index + 1, elapsed_count)
+
+            remaining_time = start_time + write_index * interval - perf_counter()
+
+            if remaining_time > 0:
+                sleep(remaining_time)
+
     def _read_response_message(self, command: _MspCommand) -> _MspResponseMessage:
         """
         Reads a response message from the FC using the MSP command.
@@ -279,17 +336,23 @@ class MultiWii(object):
 
             sleep(self._message_write_read_delay)
 
-            header = self._serial_port.read(3)
+            buffer = self._response_buffer
 
-            if header == MESSAGE_ERROR_HEADER:
+            if self._serial_port.readinto(buffer[:5]) < 5:
+                raise MspMessageError('Incomplete message header received.')
+
+            header = int.from_bytes(buffer[:3], 'little')
+
+            if header == _MESSAGE_ERROR_HEADER_VALUE:
                 raise MspMessageError('An error has occured.') 
 
-            if header != MESSAGE_INCOMING_HEADER:
+            if header != _MESSAGE_INCOMING_HEADER_VALUE:
                 raise MspMessageError('Invalid incoming message preamble received.')
 
-            command_code = self._serial_port.read(1)
+            data_size    = buffer[3]
+            command_code = buffer[4]
 
-            if command_code[0] != command.code:
+            if command_code != command.code:
                 raise MspMessageError(
                     'Invalid command code detected. ({}, {})'.format(
                         command.code,
@@ -297,22 +360,17 @@ class MultiWii(object):
                     )
                 )
 
-            payload = bytes()
-
-            payload += command_code
+            checksum_index = data_size + 5
 
-            data_size = self._serial_port.read(1)
-            data      = self._serial_port.read(data_size[0])
+            if self._serial_port.readinto(buffer[5:checksum_index + 1]) < data_size + 1:
+                raise MspMessageError(f'Incomplete payload received for {command}.')
 
-            payload += data_size
-            payload += data
+            checksum = _crc8_xor(buffer[5:checksum_index], data_size ^ command_code)
 
-            checksum = self._serial_port.read(1)
-
-            if checksum[0] != _crc8_xor(payload):
+            if buffer[checksum_index] != checksum:
                 raise MspMessageError(f'Invalid payload checksum detected for {command}.')
         
-            return _parse_response_message(command, payload)
+            return _parse_response_message(command, buffer[3:checksum_index])
         finally:
             self._serial_port.reset_input_buffer()
 
@@ -327,10 +385,14 @@ class MultiWii(object):
         data : tuple[int]
             Data values to serialize and include in the message payload.
         """
-        try:
-            self._serial_port.write(_create_request_message(command, data))
-        finally:
-            self._serial_port.reset_output_buffer()
+        if not data:
+            self._serial_port.write(_create_empty_request_message(command))
+
+            return
+
+        message_size = _pack_request_message(self._request_buffer, command, data)
+
+        self._serial_port.write(self._request_buffer[:message_size])
 
     def arm(self) -> NoReturn:
         """
@@ -357,16 +419,7 @@ class MultiWii(object):
             aux4=0
         )
 
-        start_time = perf_counter()
-
-        elapsed_time = 0
-
-        while elapsed_time < 0.5:
-            self.set_raw_rc(data)
-
-            sleep(0.05)
-
-            elapsed_time = perf_counter() - start_time
+        self._hold_raw_rc(data, duration=0.5, interval=0.05)
 
     def bind_transmitter_and_receiver(self) -> NoReturn:
         """
@@ -439,16 +492,7 @@ class MultiWii(object):
             aux4=0
         )
 
-        start_time = perf_counter()
-
-        elapsed_time = 0
-
-        while elapsed_time < 0.5:
-            self.set_raw_rc(data)
-
-            sleep(0.05)
-
-            elapsed_time = perf_counter() - start_time
+        self._hold_raw_rc(data, duration=0.5, interval=0.05)
 
     def get_data(self, command: _MspCommand) -> Any:
         """
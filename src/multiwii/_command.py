@@ -1,5 +1,5 @@
-from struct import calcsize
-from typing import Final, NoReturn
+from struct import Struct
+from typing import NoReturn
 
 class _MspCommand(object):
     """
@@ -10,17 +10,17 @@ class _MspCommand(object):
     if it is a set-command, and details about the structure format used for serializing and
     deserializing corresponding data values.
     """
-    _code: Final[int]
-
-    _data_field_count: Final[int]
-
-    _data_size: Final[int]
-
-    _has_variable_size: Final[bool]
-
-    _is_set_command: Final[bool]
-
-    _payload_struct_format: Final[str]
+    __slots__ = (
+        '_code',
+        '_data_field_count',
+        '_data_size',
+        '_data_struct',
+        '_has_string_data',
+        '_has_variable_size',
+        '_is_set_command',
+        '_payload_struct_format',
+        '_repr'
+    )
 
     def __init__(self, code: int, data_format: str = None) -> NoReturn:
         """
@@ -28,9 +28,10 @@ class _MspCommand(object):
 
         Note
         ----
-        This constructor will use `struct.calcsize` to calculate the data size of the data
-        structure format, and to validate the format string itself. Invalid format strings
-        will cause `struct.calcsize` to raise an exception of type `struct.error`.
+        This constructor will compile the data structure format into a `struct.Struct` instance,
+        which is used to calculate the data size and to validate the format string itself.
+        Invalid format strings will cause `struct.Struct` to raise an exception of type
+        `struct.error`.
 
         Parameters
         ----------
@@ -64,24 +65,40 @@ class _MspCommand(object):
 
         self._code = code
 
+        self._has_string_data = data_struct_format == 's'
+
         self._has_variable_size = has_variable_size
 
         self._is_set_command = code >= 200
 
-        if not data_struct_format:
+        if data_struct_format:
+            self._data_struct = Struct(f'<{data_struct_format}')
+
+            self._data_size = self._data_struct.size
+
+            self._data_field_count = data_field_count
+
+            self._payload_struct_format = f'<2B{data_struct_format}'
+        else:
             self._data_field_count = 0
 
             self._data_size = 0
 
-            self._payload_struct_format = None 
-
-            return
+            self._data_struct = None
 
-        self._data_size = calcsize(f'<{data_struct_format}') 
+            self._payload_struct_format = None 
 
-        self._data_field_count = data_field_count
+        if has_variable_size:
+            data_struct_format = f'*{data_struct_format}'
 
-        self._payload_struct_format = f'<2B{data_struct_format}'
+        self._repr = '{}<{}, "{}", {}, {}, "{}">'.format(
+            self.__class__.__name__,
+            code,
+            data_struct_format,
+            self._data_size,
+            self._data_field_count,
+            '?' if has_variable_size else '!'
+        )
 
     def __int__(self) -> int:
         """
@@ -92,37 +109,28 @@ class _MspCommand(object):
         int
             The MSP command code.
         """
-        self._code
+        return self._code
 
     def __repr__(self) -> str:
         """
         Returns a string representation of the object.
 
-        This method perform formats a string using the following values:
+        The string is formatted once at initialization using the following values, since the
+        object is not mutated afterwards:
 
             * Class name
             * Command code
             * Data structure format
             * Data size
+            * Data field count
+            * Variable size indicator
 
         Returns
         -------
         str
             A detailed string representation of the object.
         """
-        data_struct_format = self.data_struct_format
-
-        if self._has_variable_size:
-            data_struct_format = f'*{data_struct_format}'
-
-        return '{}<{}, "{}", {}, {}, "{}">'.format(
-            self.__class__.__name__,
-            self._code,
-            data_struct_format,
-            self._data_size,
-            self._data_field_count,
-            '?' if self._has_variable_size else '!'
-        )
+        return self._repr
 
     def __str__(self) -> str:
         """
@@ -171,6 +179,19 @@ class _MspCommand(object):
         """
         return self._data_size
 
+    @property
+    def data_struct(self) -> Struct:
+        """
+        Gets the compiled data structure.
+
+        Returns
+        -------
+        Struct
+            The precompiled `struct.Struct` instance for the data structure format, or None if
+            the command has no data values.
+        """
+        return self._data_struct
+
     @property
     def data_struct_format(self) -> str:
         """
@@ -185,6 +206,18 @@ class _MspCommand(object):
 
         return format[3:] if format else None
 
+    @property
+    def has_string_data(self) -> bool:
+        """
+        Gets a value indicative whether the data is a single string, such as a list of names.
+
+        Returns
+        -------
+        bool
+            True if the data is a single string, False otherwise.
+        """
+        return self._has_string_data
+
     @property
     def has_variable_size(self) -> bool:
         """
@@ -1,48 +1,153 @@
-from enum import IntEnum, unique
+from enum   import IntEnum, unique
+from typing import Final, NoReturn
 
-@unique
-class MultiWiiBox(IntEnum):
+def _get_constant_names(cls: type) -> dict[int, str]:
+    """
+    Gets the names of the public integer constants of a class, keyed by their values.
+
+    Parameters
+    ----------
+    cls : type
+        The class to get the constant names for.
+
+    Returns
+    -------
+    dict[int, str]
+        A dictionary with the constant names keyed by their values.
+    """
+    return {
+        value: name for name, value in vars(cls).items()
+        if not name.startswith('_') and isinstance(value, int)
+    }
+
+class MultiWiiBox(object):
     """
     Represents the various boxes that can be checked in a MultiWii flight controller.
 
     Each box corresponds to a specific function or mode that can be activated in the
     flight controller's configuration.
+
+    Note
+    ----
+    The boxes are plain integer constants rather than enum members, since they are looked up
+    for every box when decoding MSP_BOX and MSP_BOXIDS data. Use `MultiWiiBox.name` to get the
+    name of a box value. The class cannot be instantiated or iterated, and the values have no
+    `name` or `value` attributes.
     """
-    Arm       = 0
-    Angle     = 1
-    Horizon   = 2
-    Baro      = 3
-    Vario     = 4
-    Mag       = 5
-    HeadFree  = 6
-    HeadAdj   = 7
-    CamStab   = 8
-    CamTrig   = 9
-    GpsHome   = 10
-    GpsHold   = 11
-    Passthru  = 12
-    Beeper    = 13
-    LedMax    = 14
-    LedLow    = 15
-    LLights   = 16
-    Calib     = 17
-    Governor  = 18
-    OsdSwitch = 19
-    Mission   = 20
-    Land      = 21
+    Arm:       Final[int] = 0
+    Angle:     Final[int] = 1
+    Horizon:   Final[int] = 2
+    Baro:      Final[int] = 3
+    Vario:     Final[int] = 4
+    Mag:       Final[int] = 5
+    HeadFree:  Final[int] = 6
+    HeadAdj:   Final[int] = 7
+    CamStab:   Final[int] = 8
+    CamTrig:   Final[int] = 9
+    GpsHome:   Final[int] = 10
+    GpsHold:   Final[int] = 11
+    Passthru:  Final[int] = 12
+    Beeper:    Final[int] = 13
+    LedMax:    Final[int] = 14
+    LedLow:    Final[int] = 15
+    LLights:   Final[int] = 16
+    Calib:     Final[int] = 17
+    Governor:  Final[int] = 18
+    OsdSwitch: Final[int] = 19
+    Mission:   Final[int] = 20
+    Land:      Final[int] = 21
 
-@unique
-class MultiWiiBoxState(IntEnum):
+    _NAMES: dict[int, str]
+
+    def __new__(cls, *args, **kwargs) -> NoReturn:
+        """
+        Prevents instantiation, since the values are plain integer constants.
+
+        Raises
+        ------
+        TypeError
+            Always.
+        """
+        raise TypeError(f'{cls.__name__} values are integer constants and cannot be instantiated.')
+
+    @classmethod
+    def name(cls, value: int) -> str:
+        """
+        Gets the name of a box value.
+
+        Parameters
+        ----------
+        value : int
+            The box value.
+
+        Raises
+        ------
+        KeyError
+            If the value does not represent a box.
+
+        Returns
+        -------
+        str
+            The name of the box.
+        """
+        return cls._NAMES[value]
+
+class MultiWiiBoxState(object):
     """
     Represents the state of an auxiliary (aux) control box in MultiWii flight controller.
 
     The state indicates whether the box is unselected (Empty), or selected at a LOW (Low),
     MID (Mid), or HIGH (High) position.
+
+    Note
+    ----
+    The states are plain integer constants rather than enum members. Use
+    `MultiWiiBoxState.name` to get the name of a state value. The class cannot be instantiated
+    or iterated, and the values have no `name` or `value` attributes.
     """
-    Empty = 0b000
-    Low   = 0b001
-    Mid   = 0b010
-    High  = 0b100
+    Empty: Final[int] = 0b000
+    Low:   Final[int] = 0b001
+    Mid:   Final[int] = 0b010
+    High:  Final[int] = 0b100
+
+    _NAMES: dict[int, str]
+
+    def __new__(cls, *args, **kwargs) -> NoReturn:
+        """
+        Prevents instantiation, since the values are plain integer constants.
+
+        Raises
+        ------
+        TypeError
+            Always.
+        """
+        raise TypeError(f'{cls.__name__} values are integer constants and cannot be instantiated.')
+
+    @classmethod
+    def name(cls, value: int) -> str:
+        """
+        Gets the name of a box state value.
+
+        Parameters
+        ----------
+        value : int
+            The box state value.
+
+        Raises
+        ------
+        KeyError
+            If the value does not represent a box state.
+
+        Returns
+        -------
+        str
+            The name of the box state.
+        """
+        return cls._NAMES[value]
+
+MultiWiiBox._NAMES = _get_constant_names(MultiWiiBox)
+
+MultiWiiBoxState._NAMES = _get_constant_names(MultiWiiBoxState)
 
 @unique
 class MultiWiiCapability(IntEnum):
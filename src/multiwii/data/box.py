@@ -1,10 +1,9 @@
-from ..config    import MultiWiiBox, MultiWiiBoxState
 from ..messaging import _decode_names
 
 from dataclasses import dataclass
 from typing      import Self
 
-@dataclass
+@dataclass(slots=True)
 class MspBoxItem:
     """
     Represents data values for the MSP_SET_BOX command.
@@ -18,17 +17,17 @@ class MspBoxItem:
         * Mid   (0b010) (MID)
         * High  (0b100) (HIGH)
     """
-    aux1: MultiWiiBoxState
-    """MultiWiiStateBox: The state value for the first auxiliary function."""
+    aux1: int
+    """int: The `MultiWiiBoxState` value for the first auxiliary function."""
 
-    aux2: MultiWiiBoxState
-    """MultiWiiStateBox: The state value for the second auxiliary function."""
+    aux2: int
+    """int: The `MultiWiiBoxState` value for the second auxiliary function."""
 
-    aux3: MultiWiiBoxState
-    """MultiWiiStateBox: The state value for the third auxiliary function."""
+    aux3: int
+    """int: The `MultiWiiBoxState` value for the third auxiliary function."""
 
-    aux4: MultiWiiBoxState
-    """MultiWiiStateBox: The state value for the fourth auxiliary function."""
+    aux4: int
+    """int: The `MultiWiiBoxState` value for the fourth auxiliary function."""
 
     @classmethod
     def parse(cls, value: int) -> Self:
@@ -47,10 +46,10 @@ class MspBoxItem:
             An instance of the `MspBoxItem` class with parsed box item state values.
         """
         return cls(
-            aux1=MultiWiiBoxState(value & 0x7),
-            aux2=MultiWiiBoxState((value >> 3) & 0x7),
-            aux3=MultiWiiBoxState((value >> 6) & 0x7),
-            aux4=MultiWiiBoxState((value >> 9) & 0x7)
+            aux1=value & 0x7,
+            aux2=(value >> 3) & 0x7,
+            aux3=(value >> 6) & 0x7,
+            aux4=(value >> 9) & 0x7
         )
 
     def compile(self) -> int:
@@ -65,7 +64,7 @@ class MspBoxItem:
         """
         return self.aux1 | self.aux2 << 3 | self.aux3 << 6 | self.aux4 << 9
 
-@dataclass
+@dataclass(slots=True)
 class MspBox:
     """
     Represents data values for the MSP_BOX command.
@@ -104,13 +103,13 @@ class MspBox:
         tuple[int]
             A tuple with serializable integer values.
         """
-        return (box_item.compile() for box_item in self.values)
+        return tuple(box_item.compile() for box_item in self.items)
 
-@dataclass
+@dataclass(slots=True)
 class MspBoxIds:
     """Represents data values for the MSP_BOXIDS command."""
-    values: tuple[MultiWiiBox]
-    """tuple[MultiWiiBox]: A tuple with `MultiWiiBox` values."""
+    values: tuple[int]
+    """tuple[int]: A tuple with `MultiWiiBox` values."""
 
     @classmethod
     def parse(cls, data: tuple) -> Self:
@@ -128,9 +127,9 @@ class MspBoxIds:
         MspBoxIds
             An instance of the `MspBoxIds` class populated with the parsed data.
         """
-        return cls(tuple(MultiWiiBox(value) for value in data))
+        return cls(tuple(data))
 
-@dataclass
+@dataclass(slots=True)
 class MspBoxNames:
     """
     Represents data values for the MSP_BOXNAMES command.
@@ -158,4 +157,4 @@ class MspBoxNames:
         MspBoxNames
             An instance of the `MspBoxNames` class populated with the parsed data.
         """
-        return cls(decode_names(data))
+        return cls(_decode_names(data))
@@ -3,7 +3,7 @@ from ..config import MultiWiiCapability, MultiWiiMultitype, MultiWiiSensor
 from dataclasses import dataclass
 from typing      import Self
 
-@dataclass
+@dataclass(slots=True)
 class MspAnalog:
     """
     Represents data values for the MSP_ANALOG command.
@@ -46,7 +46,7 @@ class MspAnalog:
             amperage=data[3]
         )
 
-@dataclass
+@dataclass(slots=True)
 class MspIdent:
     """
     Represents data values for the MSP_IDENT command.
@@ -98,7 +98,7 @@ class MspIdent:
             navigation_version=data[3]
         )
 
-@dataclass
+@dataclass(slots=True)
 class MspMisc:
     """
     Represents data values for the MSP_MISC command.
@@ -174,7 +174,7 @@ class MspMisc:
             battery_critical=data[11] / 10.0
         )
 
-@dataclass
+@dataclass(slots=True)
 class MspSetMisc:
     """
     Represents data values for the MSP_SET_MISC command.
@@ -243,7 +243,7 @@ class MspSetMisc:
             int(self.battery_critical * 10)
         )
 
-@dataclass
+@dataclass(slots=True)
 class MspStatus:
     """
     Represents data values for the MSP_STATUS command.
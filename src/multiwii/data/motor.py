@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from typing      import Self
 
-@dataclass
+@dataclass(slots=True)
 class MspMotor:
     """
     Represents data values for the MSP_MOTOR command.
@@ -62,7 +62,7 @@ class MspMotor:
         """
         return (motor1, motor2, motor3, motor4, motor5, motor6, motor7, motor8)
 
-@dataclass
+@dataclass(slots=True)
 class MspMotorPins(MspMotor):
     """
     Represents data values for the MSP_MOTOR_PINS command.
@@ -3,7 +3,7 @@ from . import Coordinates
 from dataclasses import dataclass
 from typing      import Self
 
-@dataclass
+@dataclass(slots=True)
 class MspCompGps:
     """
     Represents data values for the MSP_COMP_GPS command.
@@ -39,7 +39,7 @@ class MspCompGps:
         """
         return cls(*data)
 
-@dataclass
+@dataclass(slots=True)
 class MspRawGps:
     """
     Represents data values for the MSP_RAW_GPS command.
@@ -114,7 +114,7 @@ class MspRawGps:
             int(ground_course * 10)
         )
 
-@dataclass
+@dataclass(slots=True)
 class MspWaypoint:
     """
     Represents data values for the MSP_WP command.
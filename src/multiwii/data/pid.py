@@ -3,9 +3,10 @@ from . import Pid
 from ..messaging import _decode_names
 
 from dataclasses import dataclass
+from itertools   import chain
 from typing      import Self
 
-@dataclass
+@dataclass(slots=True)
 class MspPid:
     """
     Represents data values for the MSP_PID command.
@@ -59,18 +60,9 @@ class MspPid:
         MspPid
             An instance of the `MspPid` class populated with the parsed data.
         """
-        pid_collection = ()
+        values = iter(data)
 
-        for index in range(len(data), step=3):
-            pid = Pid(
-                p=data[index],
-                i=data[index + 1],
-                d=data[index + 2]
-            )
-
-            pid_collection += (pid,)
-
-        return cls(*pid_collection)
+        return cls(*map(Pid, values, values, values))
 
     def as_serializable(self) -> tuple[int]:
         """
@@ -81,49 +73,20 @@ class MspPid:
         tuple[int]
             A tuple with serializable integer values.
         """
-        return (
-            roll.p,
-            roll.i,
-            roll.d,
-
-            pitch.p,
-            pitch.i,
-            pitch.d,
-
-            yaw.p,
-            yaw.i,
-            yaw.d,
-
-            altitude_hold.p,
-            altitude_hold.i,
-            altitude_hold.d,
-
-            position_hold.p,
-            position_hold.i,
-            position_hold.d,
-
-            position_rate.p,
-            position_rate.i,
-            position_rate.d,
-
-            navigation_rate.p,
-            navigation_rate.i,
-            navigation_rate.d,
-
-            level_mode.p,
-            level_mode.i,
-            level_mode.d,
-
-            magnetometer.p,
-            magnetometer.i,
-            magnetometer.d,
-
-            velocity.p,
-            velocity.i,
-            velocity.d
-        )
-
-@dataclass
+        return tuple(chain(
+            self.roll,
+            self.pitch,
+            self.yaw,
+            self.altitude_hold,
+            self.position_hold,
+            self.position_rate,
+            self.navigation_rate,
+            self.level_mode,
+            self.magnetometer,
+            self.velocity
+        ))
+
+@dataclass(slots=True)
 class MspPidNames:
     """
     Represents data values for the MSP_PIDNAMES command.
@@ -150,4 +113,4 @@ class MspPidNames:
         MspPidNames
             An instance of the `MspPidNames` class populated with the parsed data.
         """
-        return cls(decode_names(data))
+        return cls(_decode_names(data))
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from typing      import Self
 
-@dataclass
+@dataclass(slots=True)
 class MspRc:
     """
     Represents data values for the MSP_RC command.
@@ -49,20 +49,32 @@ class MspRc:
         MspRc
             An instance of the `MspRc` class populated with the parsed data.
         """
-        return cls(*data)
+        return cls(*data[:8])
 
     def as_serializable(self) -> tuple[int]:
         """
         Returns a tuple with integer values to be used for serialization.
 
+        The MSP_SET_RAW_RC command carries 16 channels, so the remaining 8 channels are padded
+        with the neutral value of 1500.
+
         Returns
         -------
         tuple[int]
             A tuple with serializable integer values.
         """
-        return (roll, pitch, yaw, throttle, aux1, aux2, aux3, aux4)
-
-@dataclass
+        return (
+            self.roll,
+            self.pitch,
+            self.yaw,
+            self.throttle,
+            self.aux1,
+            self.aux2,
+            self.aux3,
+            self.aux4
+        ) + (1500,) * 8
+
+@dataclass(slots=True)
 class MspRcTuning:
     """
     Represents data values for the MSP_RC_TUNING command.
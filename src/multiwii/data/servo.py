@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from typing      import Self
 
-@dataclass
+@dataclass(slots=True)
 class MspServo:
     """
     Represents data values for the MSP_SERVO command.
@@ -29,7 +29,7 @@ class MspServo:
         """
         return cls(*data)
 
-@dataclass
+@dataclass(slots=True)
 class MspServoConfItem:
     """
     Represents data values for the MSP_SET_SERVO_CONF command.
@@ -49,7 +49,7 @@ class MspServoConfItem:
     rate: int
     """int: The rate vlaue for the servo channel."""
 
-@dataclass
+@dataclass(slots=True)
 class MspServoConf:
     """
     Represents data values for the MSP_SERVO_CONF command.
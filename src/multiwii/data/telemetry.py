@@ -3,7 +3,7 @@ from . import Point3D
 from dataclasses import dataclass
 from typing      import Self
 
-@dataclass
+@dataclass(slots=True)
 class MspAltitude:
     """
     Represents data values for the MSP_ALTITUDE command.
@@ -34,7 +34,7 @@ class MspAltitude:
         """
         return cls(*data)
 
-@dataclass
+@dataclass(slots=True)
 class MspAttitude:
     """
     Represents data values for the MSP_ATTITUDE command.
@@ -72,7 +72,7 @@ class MspAttitude:
             yaw_angle=data[3]
         )
 
-@dataclass
+@dataclass(slots=True)
 class MspRawImu:
     """
     Represents data values for the MSP_RAW_IMU command.
@@ -1,16 +1,29 @@
 from ._command import _MspCommand
 
-from typing import Final, NamedTuple
-from struct import pack, unpack
+from functools import cache
+from struct    import Struct
+from typing    import Final, NamedTuple
 
 MESSAGE_ERROR_HEADER: Final[bytes] = b'$M!'
 """bytes: The serialized error message header. (0x24, 0x4d, 0x21)"""
 
-MESSAGE_INCOMING_HEADER: Final[bytes] = b'$M<'
-"""bytes: The serialized incoming message header. (0x24, 0x4d, 0x3c)"""
+MESSAGE_INCOMING_HEADER: Final[bytes] = b'$M>'
+"""bytes: The serialized incoming message header. (0x24, 0x4d, 0x3e)"""
 
-MESSAGE_OUTGOING_HEADER: Final[bytes] = b'$M>'
-"""bytes: The serialized outgoing message header. (0x24, 0x4d, 0x3e)"""
+MESSAGE_OUTGOING_HEADER: Final[bytes] = b'$M<'
+"""bytes: The serialized outgoing message header. (0x24, 0x4d, 0x3c)"""
+
+_MESSAGE_ERROR_HEADER_VALUE: Final[int] = int.from_bytes(MESSAGE_ERROR_HEADER, 'little')
+"""int: The error message header as a little-endian integer."""
+
+_MESSAGE_INCOMING_HEADER_VALUE: Final[int] = int.from_bytes(MESSAGE_INCOMING_HEADER, 'little')
+"""int: The incoming message header as a little-endian integer."""
+
+_CRC8_XOR_FOLD_MIN_SIZE: Final[int] = 128
+"""int: The payload size from which the checksum is folded as an integer instead of per byte."""
+
+MESSAGE_MAX_SIZE: Final[int] = 261
+"""int: The maximum size of a message. (header, data size, code, 255 data bytes and checksum)"""
 
 class _MspResponseMessage(NamedTuple):
     """
@@ -35,32 +48,77 @@ class MspMessageError(Exception):
     """Represents a specific errors related to MSP messages."""
     pass
 
-def _crc8_xor(payload: bytes) -> int:
+def _crc8_xor(payload: bytes, checksum: int = 0) -> int:
     """
     Calculates the checksum for the payload using an XOR CRC.
 
+    Payloads of at least `_CRC8_XOR_FOLD_MIN_SIZE` bytes are read as a single little-endian
+    integer that is folded in half until one byte remains. Shorter payloads, which covers all
+    fixed-size MSP messages, are XORed byte by byte, since the integer operations cost more
+    than the loop below that size.
+
     Parameters
     ----------
     payload : bytes
-        Bytes of the full payload (including the command code and size).
+        Bytes of the payload to checksum. Either the full payload including the data size and
+        command code, or only the data bytes with `checksum` seeded accordingly.
+    checksum : int, optional
+        A checksum to continue from, e.g. the XOR of the data size and command code when the
+        payload only consists of the data bytes (default is 0).
 
     Returns
     -------
     int
         The checksum for the provided payload.
     """
-    checksum = 0
+    size = len(payload)
+
+    if size < _CRC8_XOR_FOLD_MIN_SIZE:
+        for byte in payload: checksum ^= byte
+
+        return checksum
+
+    value = int.from_bytes(payload, 'little')
+
+    while size > 1:
+        size = (size + 1) >> 1
+
+        shift = size << 3
+
+        value = (value >> shift) ^ (value & ((1 << shift) - 1))
+
+    return value ^ checksum
+
+@cache
+def _get_variable_data_struct(command: _MspCommand, item_count: int) -> Struct:
+    """
+    Gets the compiled data structure for a given number of items of a variable-size command.
 
-    for byte in payload: checksum ^= byte
+    The structure is compiled once per command and item count and cached for subsequent calls,
+    so the data values of a message can be packed or unpacked with a single call.
 
-    return checksum & 0xff
+    Attributes
+    ----------
+    command : _MspCommand
+        An instance of `_MspCommand` representing a variable-size MSP command.
+    item_count : int
+        The number of items in the data values.
 
-def _create_request_message(command: _MspCommand, data: tuple[int]) -> bytes:
+    Returns
+    -------
+    Struct
+        A `struct.Struct` instance for the data structure format repeated `item_count` times.
     """
-    Constructs a serialized message for a provided command and data values.
+    return Struct(f'<{command.data_struct_format * item_count}')
+
+def _pack_request_message(buffer: memoryview, command: _MspCommand, data: tuple[int]) -> int:
+    """
+    Serializes a message for a provided command and data values into a buffer.
 
     Attributes
     ----------
+    buffer : memoryview
+        A writable buffer of at least `MESSAGE_MAX_SIZE` bytes to serialize the message into.
     command : _MspCommand
         An instance of `_MspCommand` representing the MSP command used to create the
         message.
@@ -69,33 +127,64 @@ def _create_request_message(command: _MspCommand, data: tuple[int]) -> bytes:
 
     Returns
     -------
-    bytes
-        The full message in bytes.
+    int
+        The size of the full message in bytes.
     """
     data_size = 0
 
-    payload_content = bytes()
-
     if data:
         if command.has_variable_size:
-            data_size = len(data) / command.data_field_count
+            item_count = len(data) // command.data_field_count
+
+            data_size = item_count * command.data_size
+
+            _get_variable_data_struct(command, item_count).pack_into(buffer, 5, *data)
         else:
             data_size = command.data_size
 
-        payload_content = pack(command.data_struct_format, *data)
+            command.data_struct.pack_into(buffer, 5, *data)
+
+    buffer[:3] = MESSAGE_OUTGOING_HEADER
 
-    payload_header = pack('<2B', data_size, command.code)
+    buffer[3] = data_size
+    buffer[4] = command.code
 
-    payload = payload_header + payload_content
+    checksum_index = data_size + 5
 
-    checksum = pack('<B', _crc8_xor(payload))
+    buffer[checksum_index] = _crc8_xor(buffer[3:checksum_index])
 
-    return MESSAGE_OUTGOING_HEADER + payload + checksum
+    return checksum_index + 1
+
+@cache
+def _create_empty_request_message(command: _MspCommand) -> bytes:
+    """
+    Constructs a serialized message without data values for a provided command.
+
+    The message only depends on the command code, so it is constructed once per command and
+    cached for subsequent calls.
+
+    Attributes
+    ----------
+    command : _MspCommand
+        An instance of `_MspCommand` representing the MSP command used to create the
+        message.
+
+    Returns
+    -------
+    bytes
+        The full message in bytes.
+    """
+    payload = bytes((0, command.code))
+
+    return MESSAGE_OUTGOING_HEADER + payload + bytes((_crc8_xor(payload),))
 
 def _decode_names(data: tuple) -> tuple[str]:
     """
     Decodes the deserialized string value and splits it to a tuple.
 
+    Each name is terminated by a semicolon, so the trailing separator is stripped before
+    splitting.
+
     Parameters
     ----------
     data : tuple
@@ -106,18 +195,25 @@ def _decode_names(data: tuple) -> tuple[str]:
     tuple[str]
         A tuple of decoded names.
     """
-    return tuple(data[0].decode('ascii').split(';'))
+    return tuple(data[0].decode('ascii').rstrip(';').split(';'))
 
-def _parse_response_message(command: _MspCommand, payload: bytes) -> _MspResponseMessage:
+def _parse_response_message(command: _MspCommand, payload: memoryview) -> _MspResponseMessage:
     """
     Parses the payload of a response message for a given command.
 
+    Note
+    ----
+    The payload is a view of the reused response buffer of `MultiWii` and is only valid until
+    the next message is read. The parsed data values are copied out of the buffer, so the
+    returned message remains valid afterwards.
+
     Attributes
     ----------
     command : _MspCommand
         An instance of `_MspCommand` representing the MSP command for the response message.
-    payload : bytes
-        The received payload buffer from a response message.
+    payload : memoryview
+        A view of the received payload (data size, command code and data) of a response
+        message.
 
     Raises
     ------
@@ -140,8 +236,16 @@ def _parse_response_message(command: _MspCommand, payload: bytes) -> _MspRespons
             )
         )
 
-    data = unpack(command.data_struct_format, payload[2:])
-
     data_size = payload[0]
 
+    # Names are sent as a single string that spans the whole data block.
+    if command.has_string_data:
+        data = (bytes(payload[2:data_size + 2]),)
+    elif command.has_variable_size:
+        item_count = data_size // command.data_size
+
+        data = _get_variable_data_struct(command, item_count).unpack_from(payload, 2)
+    else:
+        data = command.data_struct.unpack_from(payload, 2)
+
     return _MspResponseMessage(command, data, data_size)
@@ -0,0 +1,23 @@
+from multiwii.config import MultiWiiBox, MultiWiiBoxState
+
+from unittest import TestCase, main
+
+class ConstantNameTest(TestCase):
+    def test_box_names(self):
+        self.assertEqual(MultiWiiBox.name(MultiWiiBox.Arm), 'Arm')
+        self.assertEqual(MultiWiiBox.name(MultiWiiBox.Land), 'Land')
+        self.assertEqual(len(MultiWiiBox._NAMES), 22)
+
+    def test_box_state_names(self):
+        self.assertEqual(MultiWiiBoxState.name(MultiWiiBoxState.High), 'High')
+        self.assertEqual(len(MultiWiiBoxState._NAMES), 4)
+
+    def test_unknown_values_raise_key_error(self):
+        with self.assertRaises(KeyError):
+            MultiWiiBox.name(-1)
+
+        with self.assertRaises(KeyError):
+            MultiWiiBoxState.name(3)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+from multiwii import (
+    MSP_BOX,
+    MSP_BOXNAMES,
+    MSP_PIDNAMES,
+    MSP_SET_RAW_RC,
+    MspBox,
+    MspBoxNames,
+    MspPidNames,
+    MultiWii
+)
+
+from multiwii.messaging import _crc8_xor, MESSAGE_INCOMING_HEADER
+
+from functools import reduce
+
+from operator import xor
+
+from serial import Serial
+
+from struct import pack
+
+from unittest import TestCase, main
+
+class FakeSerial(Serial):
+    """Represents a serial port that replays a response and records written requests."""
+
+    def __init__(self, response: bytes) -> None:
+        super().__init__()
+
+        self.requests = b''
+
+        self.response = response
+
+    def read(self, size: int = 1) -> bytes:
+        data, self.response = self.response[:size], self.response[size:]
+
+        return data
+
+    def reset_input_buffer(self) -> None:
+        pass
+
+    def write(self, data) -> int:
+        self.requests += bytes(data)
+
+        return len(data)
+
+def create_response_message(code: int, data: bytes) -> bytes:
+    payload = bytes((len(data), code)) + data
+
+    return MESSAGE_INCOMING_HEADER + payload + bytes((_crc8_xor(payload),))
+
+def get_data(command, data: bytes) -> tuple:
+    serial_port = FakeSerial(create_response_message(command.code, data))
+
+    multiwii = MultiWii(serial_port)
+
+    multiwii.message_write_read_delay = 0
+
+    return multiwii.get_data(command), serial_port.requests
+
+class ChecksumTest(TestCase):
+    def test_matches_xor_reduction(self):
+        for size in (0, 1, 127, 128, 129, 255):
+            payload = bytes((index * 37 + 11) & 0xff for index in range(size))
+
+            for checksum in (0, 0x5a):
+                with self.subTest(size=size, checksum=checksum):
+                    self.assertEqual(
+                        _crc8_xor(memoryview(payload), checksum),
+                        reduce(xor, payload, checksum)
+                    )
+
+class RequestMessageTest(TestCase):
+    def test_get_data_sends_empty_request(self):
+        _, requests = get_data(MSP_BOX, pack('<H', 0))
+
+        self.assertEqual(requests, b'$M<\x00qq')
+
+    def test_set_boxes_sends_variable_size_request(self):
+        serial_port = FakeSerial(b'')
+
+        MultiWii(serial_port).set_boxes(MspBox.parse((1, 2)))
+
+        self.assertEqual(serial_port.requests, b'$M<\x04\xcb\x01\x00\x02\x00\xcc')
+
+class ResponseMessageTest(TestCase):
+    def test_decodes_box_names(self):
+        box_names, _ = get_data(MSP_BOXNAMES, b'ARM;ANGLE;HORIZON;')
+
+        self.assertEqual(box_names, MspBoxNames(('ARM', 'ANGLE', 'HORIZON')))
+
+    def test_decodes_pid_names(self):
+        pid_names, _ = get_data(MSP_PIDNAMES, b'ROLL;PITCH;YAW;')
+
+        self.assertEqual(pid_names, MspPidNames(('ROLL', 'PITCH', 'YAW')))
+
+    def test_decodes_box_items(self):
+        values = (0b001, 0b100010001001, 0b111)
+
+        box, _ = get_data(MSP_BOX, pack('<3H', *values))
+
+        self.assertEqual(tuple(item.compile() for item in box.items), values)
+
+class VehicleControlTest(TestCase):
+    def test_arm_sends_raw_rc_frames(self):
+        serial_port = FakeSerial(b'')
+
+        MultiWii(serial_port).arm()
+
+        channels = (1500, 1500, 2000, 1000, 0, 0, 0, 0) + (1500,) * 8
+
+        payload = bytes((32, MSP_SET_RAW_RC.code)) + pack('<16H', *channels)
+
+        frame = b'$M<' + payload + bytes((_crc8_xor(payload),))
+
+        self.assertEqual(serial_port.requests, frame * 10)
+
+if __name__ == '__main__':
+    main()